@@ -1,23 +1,40 @@
 """
 FastAPI Web Service for AI Legal Chatbot
-Exposes existing chatbot functionality via HTTP API (Text-only)
+Exposes existing chatbot functionality via HTTP API (Text + Voice)
 """
 
+import asyncio
+import base64
+import json
+import logging
 import os
 import sys
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import iterate_in_threadpool
 
 # Add scripts directory to Python path
 SCRIPTS_DIR = Path(__file__).parent / "scripts"
 sys.path.insert(0, str(SCRIPTS_DIR))
 
+# Structured logging instead of print: level- and time-stamped lines
+# that land in uvicorn's log stream and respect LOG_LEVEL
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s"
+)
+logger = logging.getLogger("nyaysetu")
+
 # Lazy import pattern - heavy components loaded only on first use
 # This reduces startup memory footprint significantly
 
@@ -56,17 +73,213 @@ class ChatResponse(BaseModel):
         }
 
 
+class VoiceChatResponse(BaseModel):
+    """Voice chat response"""
+    reply: str
+    session_id: str
+    transcribed_text: str
+    audio_base64: Optional[str] = None
+    audio_path: Optional[str] = None
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
+    voice_input_available: bool = False
+    voice_output_available: bool = False
+
+
+# =============================================================================
+# CHAT QUERY MICRO-BATCHING
+# =============================================================================
+
+# Concurrent /chat requests are coalesced for a short window so their
+# query embeddings go out as ONE batched call instead of N round trips.
+# Retrieval and answer generation then proceed per-query.
+
+BATCH_WINDOW_SECONDS = 0.05
+MAX_BATCH_SIZE = 32
+
+_chat_queue: Optional[asyncio.Queue] = None
+
+
+async def _chat_batch_worker():
+    """
+    Drains the chat queue in small batches: keyword routing first (so
+    vague/refusal/template queries answer instantly), then one
+    embed_documents call for the queries that need RAG, then per-query
+    retrieval + answer in worker threads.
+    """
+    while True:
+        # Block until the first query arrives, then keep collecting
+        # for the batch window (or until the batch is full)
+        message, future = await _chat_queue.get()
+        batch = [(message, future)]
+
+        while len(batch) < MAX_BATCH_SIZE:
+            try:
+                item = await asyncio.wait_for(
+                    _chat_queue.get(), timeout=BATCH_WINDOW_SECONDS
+                )
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+
+        # Nothing below may escape: an unhandled exception would kill
+        # the worker task and leave every later /chat awaiting a
+        # future that never resolves
+        try:
+            # Keyword routing first - the non-RAG paths (clarification,
+            # refusals, document templates) answer without retrieval,
+            # so they must never pay for an embedding call
+            routed = await asyncio.gather(
+                *[
+                    asyncio.to_thread(_route_non_rag, msg)
+                    for msg, _ in batch
+                ],
+                return_exceptions=True
+            )
+
+            rag_indices = [
+                i for i, reply in enumerate(routed) if reply is None
+            ]
+
+            vectors = {}
+            if rag_indices:
+                try:
+                    from retriever import get_embeddings
+
+                    queries = [batch[i][0] for i in rag_indices]
+                    embedded = await asyncio.to_thread(
+                        get_embeddings().embed_documents, queries
+                    )
+                    vectors = dict(zip(rag_indices, embedded))
+                except Exception as e:
+                    # Embedding failed for the whole batch - fall back
+                    # to the per-query path, which handles its own
+                    # errors
+                    logger.error("Batch embedding error: %s", e)
+
+            rag_replies = await asyncio.gather(
+                *[
+                    asyncio.to_thread(
+                        _answer_with_optional_vector,
+                        batch[i][0],
+                        vectors.get(i)
+                    )
+                    for i in rag_indices
+                ],
+                return_exceptions=True
+            )
+
+            replies = list(routed)
+            for i, reply in zip(rag_indices, rag_replies):
+                replies[i] = reply
+        except Exception as e:
+            logger.error("Chat batch worker error: %s", e)
+            replies = [CHATBOT_ERROR_MESSAGE] * len(batch)
+
+        for (_, fut), reply in zip(batch, replies):
+            if isinstance(reply, BaseException):
+                logger.error("Chatbot error: %s", reply)
+                reply = CHATBOT_ERROR_MESSAGE
+            if not fut.done():
+                fut.set_result(reply)
+
+
+def _route_non_rag(user_message: str) -> Optional[str]:
+    """
+    Pure keyword routing: returns the instant reply for queries that
+    never reach retrieval, or None when the query needs RAG. Instant
+    replies are cached like any other.
+    """
+    from rag_pipeline import route_non_rag_query
+
+    reply = route_non_rag_query(user_message)
+    if reply is not None:
+        response_cache_put(user_message, reply)
+    return reply
+
+
+def _answer_with_optional_vector(user_message: str, query_vector) -> str:
+    """
+    Answer a single query, reusing the batched embedding when present.
+    Mirrors safe_chatbot_call's error handling.
+    """
+    try:
+        if query_vector is None:
+            from rag_pipeline import answer_query
+            reply = answer_query(user_message)
+        else:
+            from rag_pipeline import answer_query_with_vector
+            reply = answer_query_with_vector(user_message, query_vector)
+    except Exception as e:
+        logger.error("Chatbot error: %s", e)
+        return CHATBOT_ERROR_MESSAGE
+
+    response_cache_put(user_message, reply)
+    return reply
+
+
+async def batched_chatbot_call(user_message: str) -> str:
+    """Enqueue a query for the batch worker and await its reply."""
+    cached = response_cache_get(user_message)
+    if cached is not None:
+        return cached
+
+    future = asyncio.get_running_loop().create_future()
+    await _chat_queue.put((user_message, future))
+    return await future
 
 
 # =============================================================================
 # STARTUP / SHUTDOWN LIFECYCLE
 # =============================================================================
 
-# No startup initialization - all components loaded lazily on first request
-# This minimizes memory footprint and avoids loading heavy models at startup
+# The batch worker is wired up synchronously; heavy components are
+# pre-warmed in a background thread so the server starts accepting
+# requests immediately but the first real request finds everything hot.
+
+def _prewarm_heavy_components():
+    """
+    Touch the vector index (mmap + document store) and the
+    speech-to-text weights so no request pays the cold-load cost.
+    Failures are logged and left for the lazy path to retry.
+    """
+    try:
+        from retriever import warm_up
+        warm_up()
+        logger.info("Vector index pre-warmed")
+    except Exception as e:
+        logger.warning("Vector index pre-warm failed: %s", e)
+
+    if voice_input_available():
+        try:
+            get_voice_input_processor().warm_up()
+            logger.info("Speech-to-text model pre-warmed")
+        except Exception as e:
+            logger.warning("Speech-to-text pre-warm failed: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _chat_queue
+    _chat_queue = asyncio.Queue()
+    worker = asyncio.create_task(_chat_batch_worker())
+    prewarm = asyncio.create_task(asyncio.to_thread(_prewarm_heavy_components))
+
+    yield
+
+    worker.cancel()
+    prewarm.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
+
+    # Fail any queries still queued so their /chat requests don't hang
+    while not _chat_queue.empty():
+        _, future = _chat_queue.get_nowait()
+        if not future.done():
+            future.set_result(CHATBOT_ERROR_MESSAGE)
 
 
 # =============================================================================
@@ -76,7 +289,11 @@ class HealthResponse(BaseModel):
 app = FastAPI(
     title="AI Legal Chatbot API",
     description="HTTP API for the NyaySetu Legal Chatbot - provides legal information through text interface",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes responses several times faster than the stdlib
+    # encoder - worth having on every JSON reply for free
+    default_response_class=ORJSONResponse
 )
 
 # =============================================================================
@@ -107,19 +324,186 @@ def generate_session_id() -> str:
     return str(uuid.uuid4())
 
 
+CHATBOT_ERROR_MESSAGE = (
+    "I apologize, but I'm temporarily unable to process your request. "
+    "Please try again."
+)
+
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+# RAG traffic is highly repetitive (demo scripts and users re-ask the
+# same questions), so successful replies are cached for a short TTL
+# keyed by the normalized query text. Replies are deterministic apart
+# from LLM temperature, making short-lived reuse safe. A sqlite-backed
+# layer underneath (scripts/response_cache.py) survives restarts.
+
+RESPONSE_CACHE_TTL_SECONDS = 600
+RESPONSE_CACHE_MAX_ENTRIES = 2048
+
+_response_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+# The cache is touched from the event loop and from asyncio.to_thread
+# workers, so every OrderedDict access happens under this lock - an
+# unguarded move_to_end can race a concurrent eviction and KeyError
+_response_cache_lock = threading.Lock()
+
+
+def normalize_query(user_message: str) -> str:
+    return user_message.lower().strip()
+
+
+def response_cache_get(user_message: str) -> Optional[str]:
+    key = normalize_query(user_message)
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None:
+            expires_at, reply = entry
+            if time.monotonic() < expires_at:
+                _response_cache.move_to_end(key)
+                return reply
+            _response_cache.pop(key, None)
+
+    # Fall through to the persistent layer; promote hits to memory
+    try:
+        import response_cache
+        reply = response_cache.get(key)
+    except Exception:
+        return None
+
+    if reply is not None:
+        with _response_cache_lock:
+            _response_cache[key] = (
+                time.monotonic() + RESPONSE_CACHE_TTL_SECONDS,
+                reply
+            )
+    return reply
+
+
+def response_cache_put(user_message: str, reply: str) -> None:
+    # Never cache the failure fallback - errors should retry
+    if reply == CHATBOT_ERROR_MESSAGE:
+        return
+
+    key = normalize_query(user_message)
+    with _response_cache_lock:
+        _response_cache[key] = (
+            time.monotonic() + RESPONSE_CACHE_TTL_SECONDS,
+            reply
+        )
+        _response_cache.move_to_end(key)
+
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+    try:
+        import response_cache
+        response_cache.put(key, reply)
+    except Exception as e:
+        # Persistence is best-effort - the in-memory layer still works
+        logger.error("Response cache write error: %s", e)
+
+
 def safe_chatbot_call(user_message: str) -> str:
     """
     Safely call the chatbot with error handling.
     Uses lazy import to avoid loading heavy dependencies at startup.
     Returns error message on failure.
     """
+    cached = response_cache_get(user_message)
+    if cached is not None:
+        return cached
+
     try:
         # Lazy import - only load when actually needed
         from rag_pipeline import answer_query
-        return answer_query(user_message)
+        reply = answer_query(user_message)
     except Exception as e:
-        print(f"❌ Chatbot error: {str(e)}")
-        return "I apologize, but I'm temporarily unable to process your request. Please try again."
+        logger.error("Chatbot error: %s", e)
+        return CHATBOT_ERROR_MESSAGE
+
+    response_cache_put(user_message, reply)
+    return reply
+
+
+UPLOAD_CHUNK_BYTES = 64 * 1024
+MAX_AUDIO_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Each transcription holds model working memory and saturates cores;
+# unbounded concurrency would thrash the CPU and can OOM the 512 MB
+# tier. Excess voice requests queue here instead.
+MAX_CONCURRENT_TRANSCRIPTIONS = int(
+    os.environ.get("MAX_CONCURRENT_TRANSCRIPTIONS", "2")
+)
+
+_transcription_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
+
+
+async def read_audio_upload(audio: UploadFile) -> bytes:
+    """
+    Read an audio upload in chunks with a hard size cap, so one
+    oversized request can't balloon worker memory with a single
+    unbounded read. Rejects anything over the cap with 413.
+    """
+    buffer = bytearray()
+    while chunk := await audio.read(UPLOAD_CHUNK_BYTES):
+        buffer.extend(chunk)
+        if len(buffer) > MAX_AUDIO_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413, detail="Audio upload too large"
+            )
+    return bytes(buffer)
+
+
+# =============================================================================
+# VOICE PROCESSORS (lazy singletons)
+# =============================================================================
+
+# Created on first use so text-only deployments never pay the import cost
+_voice_input_processor = None
+_voice_output_processor = None
+
+
+def get_voice_input_processor():
+    """Lazily create the shared speech-to-text processor."""
+    global _voice_input_processor
+    if _voice_input_processor is None:
+        from voice_input import VoiceInputProcessor
+        _voice_input_processor = VoiceInputProcessor()
+    return _voice_input_processor
+
+
+def get_voice_output_processor():
+    """Lazily create the shared text-to-speech processor."""
+    global _voice_output_processor
+    if _voice_output_processor is None:
+        from voice_output import VoiceOutputProcessor
+        _voice_output_processor = VoiceOutputProcessor()
+    return _voice_output_processor
+
+
+def voice_input_available() -> bool:
+    try:
+        import faster_whisper  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def voice_output_available() -> bool:
+    if os.environ.get("PIPER_VOICE_PATH"):
+        try:
+            import piper  # noqa: F401
+            return True
+        except ImportError:
+            pass
+    try:
+        import gtts  # noqa: F401
+        return True
+    except ImportError:
+        return False
 
 
 # =============================================================================
@@ -135,7 +519,10 @@ async def root():
         "status": "operational",
         "endpoints": {
             "health": "/health",
-            "text_chat": "/chat"
+            "text_chat": "/chat",
+            "streaming_chat": "/chat/stream",
+            "voice_chat": "/chat/voice",
+            "streaming_voice_chat": "/chat/voice/stream"
         }
     }
 
@@ -144,9 +531,13 @@ async def root():
 async def health_check():
     """
     Health check endpoint.
-    Returns service status.
+    Returns service status and which voice features are available.
     """
-    return HealthResponse(status="ok")
+    return HealthResponse(
+        status="ok",
+        voice_input_available=voice_input_available(),
+        voice_output_available=voice_output_available()
+    )
 
 
 @app.post("/chat", response_model=ChatResponse, tags=["Chat"])
@@ -164,9 +555,11 @@ async def chat(request: ChatRequest):
     if not request.message or not request.message.strip():
         raise HTTPException(status_code=400, detail="Message cannot be empty")
 
-    # Get chatbot response
+    # Get chatbot response via the batch worker: concurrent queries
+    # share one embedding call, and the answer itself runs in a worker
+    # thread so the event loop stays free.
     try:
-        reply = safe_chatbot_call(request.message.strip())
+        reply = await batched_chatbot_call(request.message.strip())
     except Exception as e:
         raise HTTPException(status_code=500, detail="Chatbot temporarily unavailable")
 
@@ -177,13 +570,190 @@ async def chat(request: ChatRequest):
     )
 
 
+@app.post("/chat/stream", tags=["Chat"])
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint (Server-Sent Events).
+
+    Emits the reply incrementally as `data: {"delta": ...}` events while
+    the LLM decodes, so clients see the first tokens at first-token
+    latency instead of waiting for the full reply. A final
+    `data: {"done": true, ...}` event carries the session ID.
+    """
+    session_id = request.session_id or generate_session_id()
+
+    if not request.message or not request.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+    user_message = request.message.strip()
+
+    async def sse_gen():
+        done_event = json.dumps({"done": True, "session_id": session_id})
+
+        # Cache hit: emit the stored reply as a single delta
+        cached = response_cache_get(user_message)
+        if cached is not None:
+            yield f"data: {json.dumps({'delta': cached})}\n\n"
+            yield f"data: {done_event}\n\n"
+            return
+
+        fragments = []
+        try:
+            from rag_pipeline import answer_query_stream
+
+            # The generator blocks on the LLM, so iterate it in a
+            # worker thread to keep the event loop free
+            async for fragment in iterate_in_threadpool(
+                answer_query_stream(user_message)
+            ):
+                fragments.append(fragment)
+                yield f"data: {json.dumps({'delta': fragment})}\n\n"
+        except Exception as e:
+            logger.error("Chatbot error: %s", e)
+            yield f"data: {json.dumps({'delta': CHATBOT_ERROR_MESSAGE})}\n\n"
+            yield f"data: {done_event}\n\n"
+            return
+
+        response_cache_put(user_message, "".join(fragments))
+        yield f"data: {done_event}\n\n"
+
+    return StreamingResponse(sse_gen(), media_type="text/event-stream")
+
+
+@app.post("/chat/voice", response_model=VoiceChatResponse, tags=["Chat"])
+async def chat_voice(
+    audio: UploadFile = File(...),
+    session_id: Optional[str] = Form(None),
+    return_audio: bool = Form(True)
+):
+    """
+    Voice-based chat endpoint.
+
+    Accepts an audio file, transcribes it, runs the chatbot, and
+    optionally returns a spoken reply as base64-encoded MP3.
+
+    Transcription (Whisper), synthesis (gTTS) and the chatbot call are
+    all blocking, so each is offloaded with asyncio.to_thread — the
+    event loop never blocks for the duration of the audio, and /chat
+    and /health stay responsive under concurrent voice load.
+    """
+    if not voice_input_available():
+        raise HTTPException(status_code=503, detail="Voice input is not available")
+
+    session_id = session_id or generate_session_id()
+
+    # Decode and transcribe straight from the uploaded bytes - no temp
+    # file write/read per request
+    content = await read_audio_upload(audio)
+
+    reply_audio_path = None
+    try:
+        async with _transcription_semaphore:
+            transcribed_text = await asyncio.to_thread(
+                get_voice_input_processor().transcribe_bytes, content
+            )
+
+        if not transcribed_text.strip():
+            raise HTTPException(status_code=400, detail="Could not transcribe audio")
+
+        reply = await asyncio.to_thread(safe_chatbot_call, transcribed_text.strip())
+
+        audio_base64 = None
+        if return_audio and voice_output_available():
+            reply_audio_path = await asyncio.to_thread(
+                get_voice_output_processor().speak, reply
+            )
+            audio_bytes = await asyncio.to_thread(
+                Path(reply_audio_path).read_bytes
+            )
+            audio_base64 = base64.b64encode(audio_bytes).decode("ascii")
+
+        return VoiceChatResponse(
+            reply=reply,
+            session_id=session_id,
+            transcribed_text=transcribed_text,
+            audio_base64=audio_base64,
+            audio_path=None
+        )
+    finally:
+        if reply_audio_path:
+            Path(reply_audio_path).unlink(missing_ok=True)
+
+
+# Multiple of 3 bytes so each base64 chunk decodes standalone and
+# clients can concatenate chunks without padding issues
+AUDIO_STREAM_CHUNK_BYTES = 48 * 1024
+
+
+@app.post("/chat/voice/stream", tags=["Chat"])
+async def chat_voice_stream(
+    audio: UploadFile = File(...),
+    session_id: Optional[str] = Form(None),
+    return_audio: bool = Form(True)
+):
+    """
+    Streaming voice chat endpoint (Server-Sent Events).
+
+    Emits the transcription and reply as soon as each is ready, then
+    the spoken reply as base64-encoded audio chunks - the client can
+    start playback while later chunks are still being sent, instead of
+    waiting for one JSON body holding the whole file.
+    """
+    if not voice_input_available():
+        raise HTTPException(status_code=503, detail="Voice input is not available")
+
+    session_id = session_id or generate_session_id()
+    content = await read_audio_upload(audio)
+
+    async def sse_gen():
+        reply_audio_path = None
+        try:
+            async with _transcription_semaphore:
+                transcribed_text = await asyncio.to_thread(
+                    get_voice_input_processor().transcribe_bytes, content
+                )
+
+            if not transcribed_text.strip():
+                yield f"data: {json.dumps({'error': 'Could not transcribe audio'})}\n\n"
+                return
+
+            yield f"data: {json.dumps({'transcribed_text': transcribed_text})}\n\n"
+
+            reply = await asyncio.to_thread(
+                safe_chatbot_call, transcribed_text.strip()
+            )
+            yield f"data: {json.dumps({'reply': reply})}\n\n"
+
+            if return_audio and voice_output_available():
+                reply_audio_path = await asyncio.to_thread(
+                    get_voice_output_processor().speak, reply
+                )
+
+                with open(reply_audio_path, "rb") as audio_file:
+                    while True:
+                        chunk = await asyncio.to_thread(
+                            audio_file.read, AUDIO_STREAM_CHUNK_BYTES
+                        )
+                        if not chunk:
+                            break
+                        encoded = base64.b64encode(chunk).decode("ascii")
+                        yield f"data: {json.dumps({'audio_chunk': encoded})}\n\n"
+
+            yield f"data: {json.dumps({'done': True, 'session_id': session_id})}\n\n"
+        finally:
+            if reply_audio_path:
+                Path(reply_audio_path).unlink(missing_ok=True)
+
+    return StreamingResponse(sse_gen(), media_type="text/event-stream")
+
+
 # =============================================================================
 # ERROR HANDLERS
 # =============================================================================
 
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={"error": "Endpoint not found"}
     )
@@ -191,7 +761,7 @@ async def not_found_handler(request, exc):
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Chatbot temporarily unavailable"}
     )
@@ -203,15 +773,26 @@ async def internal_error_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    
-    print("🚀 Starting AI Legal Chatbot API (Text-only, Memory Optimized)")
-    
+
+    logger.info("Starting AI Legal Chatbot API")
+
     # Use PORT environment variable for Render compatibility
     port = int(os.environ.get("PORT", 10000))
-    
+
+    # Scale across cores with WEB_CONCURRENCY. For copy-on-write
+    # sharing of the preloaded app between workers, use the gunicorn
+    # --preload command in render.yaml instead; the mmap'd FAISS index
+    # is shared through the OS page cache either way.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+    # "auto" picks uvloop where it is installed (it is skipped on
+    # Windows, which uvloop does not support) and falls back to the
+    # stdlib loop otherwise
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=False
+        reload=False,
+        workers=workers,
+        loop="auto"
     )
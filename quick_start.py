@@ -34,7 +34,7 @@ def check_virtual_env():
 
 def check_dependencies():
     """Check if required packages are installed"""
-    required = ["fastapi", "uvicorn", "langchain", "chromadb", "openai"]
+    required = ["fastapi", "uvicorn", "langchain", "faiss", "openai"]
     missing = []
     
     for package in required:
@@ -77,14 +77,14 @@ def check_env_file():
 
 def check_vector_db():
     """Check if vector DB exists"""
-    db_path = Path("scripts/chroma_day1")
-    
+    db_path = Path("faiss_day1")
+
     if db_path.exists():
         print("✅ Vector database found")
         return True
     else:
         print("❌ Vector database not found")
-        print("   Expected: scripts/chroma_day1/")
+        print("   Expected: faiss_day1/")
         return False
 
 def print_next_steps(all_ok):
@@ -1,10 +1,14 @@
+import json
 from pathlib import Path
-from langchain_community.vectorstores import Chroma
+
+import faiss
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 from load_documents import load_documents
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR.parent / "data"
+INDEX_DIR = BASE_DIR.parent / "faiss_day1"
 
 DATA_FILES = [
     DATA_DIR / "normalized_ipc.json",
@@ -13,25 +17,62 @@ DATA_FILES = [
     DATA_DIR / "normalized_amendments.json"
 ]
 
+EMBED_BATCH_SIZE = 64
+EMBED_DIM = 1536  # text-embedding-3-small
+
 # Load all documents
-all_docs = []
-for path in DATA_FILES:
-    all_docs.extend(load_documents(path))
+all_docs = [
+    doc
+    for path in DATA_FILES
+    for doc in load_documents(path)
+]
+texts = [doc.page_content for doc in all_docs]
 
 # Use REMOTE embeddings (same as runtime)
 embeddings = OpenAIEmbeddings(
     model="text-embedding-3-small"
 )
 
-# Build and persist vector DB
-vectordb = Chroma.from_documents(
-    documents=all_docs,
-    embedding=embeddings,
-    persist_directory="chroma_day1",
-    collection_name="legal_knowledge"
+# Embed in batches straight into one preallocated float32 matrix -
+# no intermediate per-vector Python lists held for the whole corpus
+matrix = np.empty((len(texts), EMBED_DIM), dtype=np.float32)
+for start in range(0, len(texts), EMBED_BATCH_SIZE):
+    batch = texts[start:start + EMBED_BATCH_SIZE]
+    matrix[start:start + len(batch)] = embeddings.embed_documents(batch)
+
+# Flat inner-product index. The corpus is a few hundred sections, so a
+# linear scan is already microseconds; embeddings are unit-norm, so
+# inner product == cosine similarity.
+index = faiss.IndexFlatIP(matrix.shape[1])
+index.add(matrix)
+
+# Binary sidecar: sign-quantized vectors (1 bit per dimension, 32x
+# smaller) searched by Hamming distance for a cheap first pass. The
+# retriever reranks the binary candidates against the exact vectors.
+binary_index = faiss.IndexBinaryFlat(matrix.shape[1])
+binary_index.add(np.packbits(matrix > 0, axis=1))
+
+# Persist index + document store side by side
+INDEX_DIR.mkdir(exist_ok=True)
+faiss.write_index(index, str(INDEX_DIR / "index.faiss"))
+faiss.write_index_binary(binary_index, str(INDEX_DIR / "index.binary.faiss"))
+
+# Contiguous fp16 copy of the full matrix: half the bytes of the float
+# index, mmap-loaded by the retriever for the exact rerank step
+np.save(
+    str(INDEX_DIR / "embeddings.fp16.npy"),
+    np.ascontiguousarray(matrix, dtype=np.float16)
 )
 
-vectordb.persist()
+with open(INDEX_DIR / "documents.json", "w", encoding="utf-8") as f:
+    json.dump(
+        [
+            {"page_content": doc.page_content, "metadata": doc.metadata}
+            for doc in all_docs
+        ],
+        f,
+        ensure_ascii=False
+    )
 
 print(f"Vector DB created with {len(all_docs)} documents.")
-print("DB COUNT:", vectordb._collection.count())
+print("INDEX COUNT:", index.ntotal)
@@ -0,0 +1,65 @@
+"""
+One-off migration: chroma_day1 -> faiss_day1.
+
+The Chroma store persisted in chroma_day1/ already contains the
+text-embedding-3-small vectors and document texts (in the sqlite
+write-ahead log), so the FAISS artifacts that build_vectordb.py would
+produce can be rebuilt offline here - no API calls and no chromadb
+dependency. Reads the raw sqlite tables directly and writes the same
+index.faiss / index.binary.faiss / embeddings.fp16.npy /
+documents.json layout as build_vectordb.py.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+CHROMA_DB = BASE_DIR.parent / "chroma_day1" / "chroma.sqlite3"
+INDEX_DIR = BASE_DIR.parent / "faiss_day1"
+
+DOCUMENT_KEY = "chroma:document"
+
+conn = sqlite3.connect(str(CHROMA_DB))
+
+# The WAL holds every add in insert order: the FLOAT32 vector blob plus
+# the metadata JSON (which carries the document text under chroma:document)
+rows = conn.execute(
+    "SELECT vector, metadata FROM embeddings_queue "
+    "WHERE operation = 2 ORDER BY seq_id"
+).fetchall()
+
+vectors = []
+documents = []
+for vector_blob, metadata_json in rows:
+    vectors.append(np.frombuffer(vector_blob, dtype=np.float32))
+
+    metadata = json.loads(metadata_json)
+    page_content = metadata.pop(DOCUMENT_KEY)
+    documents.append({"page_content": page_content, "metadata": metadata})
+
+matrix = np.ascontiguousarray(np.vstack(vectors), dtype=np.float32)
+
+# Same artifacts as build_vectordb.py
+index = faiss.IndexFlatIP(matrix.shape[1])
+index.add(matrix)
+
+binary_index = faiss.IndexBinaryFlat(matrix.shape[1])
+binary_index.add(np.packbits(matrix > 0, axis=1))
+
+INDEX_DIR.mkdir(exist_ok=True)
+faiss.write_index(index, str(INDEX_DIR / "index.faiss"))
+faiss.write_index_binary(binary_index, str(INDEX_DIR / "index.binary.faiss"))
+np.save(
+    str(INDEX_DIR / "embeddings.fp16.npy"),
+    np.ascontiguousarray(matrix, dtype=np.float16)
+)
+
+with open(INDEX_DIR / "documents.json", "w", encoding="utf-8") as f:
+    json.dump(documents, f, ensure_ascii=False)
+
+print(f"Migrated {len(documents)} documents from {CHROMA_DB}.")
+print("INDEX COUNT:", index.ntotal)
@@ -1,7 +1,9 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from retriever import get_retriever
+from collections.abc import Iterator
+
+from retriever import get_retriever, get_vectordb
 from context_builder import build_context
 from system_prompt import LEGAL_QA_SYSTEM_PROMPT
 from langchain_openai import ChatOpenAI
@@ -114,9 +116,16 @@ def handle_document_selection(user_query: str) -> str:
 
 
 # -------------------------------------------------
-# MAIN ENTRY POINT
+# Pre-retrieval routing (vague queries + intents)
 # -------------------------------------------------
-def answer_query(user_query: str) -> str:
+def route_non_rag_query(user_query: str) -> str | None:
+    """
+    Handles every query path that does NOT need retrieval
+    (clarification, refusals, document templates).
+    Returns the final reply, or None when the query must go
+    through RAG.
+    """
+
     # ---------------------------------------------
     # Phase 2: Single-turn clarification for vague queries
     # ---------------------------------------------
@@ -146,27 +155,54 @@ def answer_query(user_query: str) -> str:
     if intent == QueryIntent.DOCUMENT_SELECTION:
         return handle_document_selection(user_query)
 
+    return None
+
+
+# -------------------------------------------------
+# MAIN ENTRY POINT
+# -------------------------------------------------
+def answer_query(user_query: str) -> str:
+    reply = route_non_rag_query(user_query)
+    if reply is not None:
+        return reply
+
     # -------------------------------------------------
     # Day-1 RAG behaviour (pure legal info)
     # -------------------------------------------------
     retriever = get_retriever()
     docs = retriever.invoke(user_query)
 
-    if not docs:
-        return "The information is not available in the current legal knowledge base."
+    return answer_from_docs(user_query, docs)
 
-    context = build_context(docs)
 
-    if not context.strip():
-        return "The information is not available in the current legal knowledge base."
+def answer_query_with_vector(user_query: str, query_vector: list[float]) -> str:
+    """
+    Same as answer_query, but retrieval uses an already-computed
+    query embedding. Lets the API layer embed several queued
+    queries in one batched call and keep retrieval per-query.
+    """
+    reply = route_non_rag_query(user_query)
+    if reply is not None:
+        return reply
 
-    llm = ChatOpenAI(
-    model="meta-llama/Llama-3.1-8B-Instruct",
-    temperature=0.25
-    )
+    vectordb = get_vectordb()
+    docs = vectordb.similarity_search_by_vector(query_vector, k=3)
+
+    return answer_from_docs(user_query, docs)
 
 
-    messages = [
+# -------------------------------------------------
+# RAG answer generation over retrieved documents
+# -------------------------------------------------
+NO_INFORMATION_MESSAGE = (
+    "The information is not available in the current legal knowledge base."
+)
+
+LEGAL_INFO_NOTE = "This is general legal information, not legal advice."
+
+
+def build_rag_messages(user_query: str, context: str) -> list[dict]:
+    return [
         {"role": "system", "content": LEGAL_QA_SYSTEM_PROMPT},
         {
             "role": "user",
@@ -180,11 +216,69 @@ Question:
         }
     ]
 
-    response = llm.invoke(messages)
+
+def make_llm() -> ChatOpenAI:
+    return ChatOpenAI(
+        model="meta-llama/Llama-3.1-8B-Instruct",
+        temperature=0.25
+    )
+
+
+def answer_from_docs(user_query: str, docs) -> str:
+    if not docs:
+        return NO_INFORMATION_MESSAGE
+
+    context = build_context(docs)
+
+    if not context.strip():
+        return NO_INFORMATION_MESSAGE
+
+    llm = make_llm()
+    response = llm.invoke(build_rag_messages(user_query, context))
 
     return format_response(
         title="Legal Information",
         explanation=response.content,
-        note="This is general legal information, not legal advice."
+        note=LEGAL_INFO_NOTE
     )
 
+
+# -------------------------------------------------
+# STREAMING ENTRY POINT
+# -------------------------------------------------
+def answer_query_stream(user_query: str) -> Iterator[str]:
+    """
+    Incremental variant of answer_query. Yields reply fragments as the
+    LLM produces them so callers can stream tokens to the client.
+    Non-RAG paths (clarification, refusals, document templates) are
+    instant and yield their full reply in one piece.
+    """
+    reply = route_non_rag_query(user_query)
+    if reply is not None:
+        yield reply
+        return
+
+    retriever = get_retriever()
+    docs = retriever.invoke(user_query)
+
+    if not docs:
+        yield NO_INFORMATION_MESSAGE
+        return
+
+    context = build_context(docs)
+
+    if not context.strip():
+        yield NO_INFORMATION_MESSAGE
+        return
+
+    llm = make_llm()
+
+    # Mirror format_response's structure around the streamed body
+    yield "Legal Information\n\nExplanation:\n"
+
+    for chunk in llm.stream(build_rag_messages(user_query, context)):
+        if chunk.content:
+            yield chunk.content
+
+    yield f"\n\nNote:\n{LEGAL_INFO_NOTE}"
+
@@ -0,0 +1,120 @@
+# scripts/response_cache.py
+
+"""
+Persistent query -> reply cache backed by sqlite.
+Keeps warm queries warm across restarts and cold starts, unlike the
+in-memory cache in main.py which this sits underneath.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = BASE_DIR / "response_cache.sqlite3"
+INDEX_DIR = BASE_DIR / "faiss_day1"
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+MAX_ROWS = 4096
+
+# Artifacts whose mtime/size identify the corpus the replies came from
+_CORPUS_FILES = ("index.faiss", "documents.json")
+
+
+@lru_cache(maxsize=1)
+def corpus_fingerprint() -> str:
+    """
+    Cheap fingerprint of the knowledge base, folded into every cache
+    key so replies generated against an old corpus die with it instead
+    of surviving a rebuild for up to the TTL.
+    """
+    parts = []
+    for name in _CORPUS_FILES:
+        try:
+            stat = (INDEX_DIR / name).stat()
+            parts.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append(f"{name}:missing")
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+def _cache_key(normalized_query: str) -> str:
+    return f"{corpus_fingerprint()}:{normalized_query}"
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+        _conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                query TEXT PRIMARY KEY,
+                reply TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        # Purge on open: expired rows are otherwise only deleted when
+        # their exact key is re-read, and rows keyed under an old
+        # corpus fingerprint would never match again at all - left
+        # alone, the file grows without bound across rebuilds
+        _conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ? "
+            "OR query NOT LIKE ?",
+            (time.time(), f"{corpus_fingerprint()}:%")
+        )
+        _conn.commit()
+    return _conn
+
+
+def get(normalized_query: str) -> str | None:
+    """Return the cached reply for a normalized query, or None."""
+    key = _cache_key(normalized_query)
+    with _lock:
+        conn = _get_conn()
+        row = conn.execute(
+            "SELECT reply, expires_at FROM responses WHERE query = ?",
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        reply, expires_at = row
+        if time.time() >= expires_at:
+            conn.execute("DELETE FROM responses WHERE query = ?", (key,))
+            conn.commit()
+            return None
+
+        return reply
+
+
+def put(
+    normalized_query: str,
+    reply: str,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS
+) -> None:
+    """Store (or refresh) the cached reply for a normalized query."""
+    with _lock:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (query, reply, expires_at) "
+            "VALUES (?, ?, ?)",
+            (_cache_key(normalized_query), reply, time.time() + ttl_seconds)
+        )
+        # Keep the table bounded under query churn: drop the rows
+        # closest to expiry once the cap is exceeded
+        conn.execute(
+            "DELETE FROM responses WHERE query NOT IN ("
+            "SELECT query FROM responses ORDER BY expires_at DESC LIMIT ?"
+            ")",
+            (MAX_ROWS,)
+        )
+        conn.commit()
@@ -1,15 +1,155 @@
-from langchain_community.vectorstores import Chroma
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import faiss
+import numpy as np
+from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
 
-def get_retriever():
-    embeddings = OpenAIEmbeddings(
+INDEX_DIR = Path(__file__).resolve().parent.parent / "faiss_day1"
+
+# Loaded once per process; the index file is memory-mapped so pages are
+# shared with the OS cache instead of copied into the heap
+_index = None
+_documents = None
+_binary_index = None
+_fp16_matrix = None
+
+# Hamming first-pass over-fetch before the exact rerank
+RERANK_CANDIDATES = 20
+
+
+@lru_cache(maxsize=1)
+def get_embeddings():
+    # One client per process - constructing OpenAIEmbeddings per call
+    # rebuilt its HTTP client (and connection pool) every time
+    return OpenAIEmbeddings(
         model="text-embedding-3-small"
     )
 
-    vectordb = Chroma(
-        persist_directory="chroma_day1",
-        embedding_function=embeddings,
-        collection_name="legal_knowledge"
-    )
 
-    return vectordb.as_retriever(search_kwargs={"k": 3})
+@lru_cache(maxsize=4096)
+def embed_query_cached(normalized_query: str) -> tuple:
+    """
+    Embed a query, memoized on the normalized (lowercased, stripped)
+    text. Repeated and near-duplicate queries skip the embedding call
+    entirely. Returns a tuple so the result is hashable for the cache.
+    """
+    return tuple(get_embeddings().embed_query(normalized_query))
+
+
+def _load_index():
+    global _index, _documents
+    if _index is None:
+        _index = faiss.read_index(
+            str(INDEX_DIR / "index.faiss"), faiss.IO_FLAG_MMAP
+        )
+        with open(INDEX_DIR / "documents.json", "r", encoding="utf-8") as f:
+            _documents = [
+                Document(
+                    page_content=item["page_content"],
+                    metadata=item["metadata"]
+                )
+                for item in json.load(f)
+            ]
+    return _index, _documents
+
+
+def _load_binary_index():
+    """
+    Sign-quantized sidecar index (optional - only present for indexes
+    built after the binary sidecar was added to build_vectordb.py).
+    """
+    global _binary_index
+    if _binary_index is None:
+        binary_path = INDEX_DIR / "index.binary.faiss"
+        if binary_path.exists():
+            _binary_index = faiss.read_index_binary(str(binary_path))
+    return _binary_index
+
+
+def _load_fp16_matrix():
+    """
+    Contiguous fp16 copy of the embedding matrix, memory-mapped so
+    reranks read half the bytes of the float32 index without pulling
+    the whole matrix into the heap. Optional, like the binary sidecar.
+    """
+    global _fp16_matrix
+    if _fp16_matrix is None:
+        matrix_path = INDEX_DIR / "embeddings.fp16.npy"
+        if matrix_path.exists():
+            _fp16_matrix = np.load(str(matrix_path), mmap_mode="r")
+    return _fp16_matrix
+
+
+def warm_up():
+    """
+    Load the index, binary sidecar and document store ahead of the
+    first query so no request pays the cold-load cost. Safe to call
+    from a startup hook; missing index files surface as the usual
+    load errors.
+    """
+    _load_index()
+    _load_binary_index()
+    _load_fp16_matrix()
+
+
+class FaissRetriever:
+    """
+    Thin retriever over a FAISS flat index, replacing the Chroma
+    vector store. Exposes the same call points rag_pipeline uses:
+    invoke(query) and similarity_search_by_vector(vector, k).
+    """
+
+    def __init__(self, k: int = 3):
+        self.k = k
+
+    def similarity_search_by_vector(self, query_vector, k: int | None = None):
+        index, documents = _load_index()
+        k = k or self.k
+
+        query = np.asarray([query_vector], dtype=np.float32)
+
+        # Fast path: Hamming search over the 1-bit sidecar, then exact
+        # rerank of the few candidates against the full-precision vectors
+        binary_index = _load_binary_index()
+        if binary_index is not None:
+            packed = np.packbits(query > 0, axis=1)
+            _, ids = binary_index.search(
+                packed, min(RERANK_CANDIDATES, index.ntotal)
+            )
+            candidates = [int(i) for i in ids[0] if i != -1]
+
+            fp16_matrix = _load_fp16_matrix()
+            if fp16_matrix is not None:
+                vectors = fp16_matrix[candidates].astype(np.float32)
+            else:
+                vectors = np.vstack(
+                    [index.reconstruct(i) for i in candidates]
+                )
+            scores = vectors @ query[0]
+            best = np.argsort(-scores)[:k]
+
+            return [documents[candidates[i]] for i in best]
+
+        _, ids = index.search(query, k)
+
+        return [documents[i] for i in ids[0] if i != -1]
+
+    def invoke(self, query: str):
+        vector = embed_query_cached(query.lower().strip())
+        return self.similarity_search_by_vector(list(vector))
+
+
+@lru_cache(maxsize=1)
+def _shared_retriever() -> FaissRetriever:
+    return FaissRetriever()
+
+
+def get_vectordb():
+    return _shared_retriever()
+
+
+def get_retriever():
+    return _shared_retriever()
@@ -0,0 +1,67 @@
+# scripts/voice_output.py
+
+"""
+Text-to-speech for the voice chat endpoint.
+Prefers a local Piper voice (no network round trip); falls back to
+gTTS when no Piper voice is configured.
+"""
+
+import os
+import tempfile
+import wave
+from pathlib import Path
+
+
+class VoiceOutputProcessor:
+    """
+    Converts chatbot replies into spoken audio.
+
+    When PIPER_VOICE_PATH points at a downloaded Piper .onnx voice,
+    synthesis runs fully locally - no per-request network call and no
+    dependence on the gTTS endpoint being reachable. Otherwise the
+    gTTS path is used so deployments without a voice file keep working.
+    """
+
+    def __init__(self, language: str = "en"):
+        self.language = language
+        self._piper_voice = None
+
+    def _load_piper(self):
+        if self._piper_voice is None:
+            model_path = os.environ.get("PIPER_VOICE_PATH")
+            if model_path and Path(model_path).exists():
+                from piper import PiperVoice
+                self._piper_voice = PiperVoice.load(model_path)
+        return self._piper_voice
+
+    def _make_temp_path(self, suffix: str) -> str:
+        out_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+        out_file.close()
+        return out_file.name
+
+    def speak(self, text: str) -> str:
+        """
+        Synthesize speech for the given text and return the path to
+        the generated audio file (WAV for Piper, MP3 for gTTS). The
+        caller owns the file and is responsible for deleting it.
+
+        NOTE: Synthesis blocks (local inference or a gTTS network
+        call). Callers inside async code must offload it
+        (e.g. asyncio.to_thread).
+        """
+        try:
+            voice = self._load_piper()
+        except ImportError:
+            voice = None
+
+        if voice is not None:
+            out_path = self._make_temp_path(".wav")
+            with wave.open(out_path, "wb") as wav_file:
+                voice.synthesize(text, wav_file)
+            return out_path
+
+        from gtts import gTTS
+
+        out_path = self._make_temp_path(".mp3")
+        gTTS(text=text, lang=self.language).save(out_path)
+        return out_path